@@ -94,14 +94,14 @@ def callable(*args, complex=False, jit=True, parameterized=False, vectorized=Fal
         return wrap(args[0])
 
 
-def real_callable(*args, jit=True):
+def real_callable(*args, jit=True, vectorized=False):
     """Wrap function as a real Numba callable."""
-    return callable(*args, complex=False, jit=jit)
+    return callable(*args, complex=False, jit=jit, vectorized=vectorized)
 
 
-def complex_callable(*args, jit=True):
+def complex_callable(*args, jit=True, vectorized=False):
     """Wrap function as a complex Numba callable."""
-    return callable(*args, complex=True, jit=jit)
+    return callable(*args, complex=True, jit=jit, vectorized=vectorized)
 
 
 class GridFunction(object):
@@ -161,6 +161,12 @@ class GridFunction(object):
                 fun(x,n,domain_index,result):
                     result[0] =  np.dot(x,n)
 
+           A callable wrapped with vectorized=True is called only once.
+           Then x and n are arrays of shape (3, N) holding all quadrature
+           points and normals, domain_index has length N and result has
+           shape (codomain_dimension, N). The body of such a callable can
+           itself be compiled with numba.njit(parallel=True).
+
         2. By providing a vector of coefficients at the nodes. This is
            preferable if the coefficients of the data are coming from an
            external code.
@@ -809,6 +815,7 @@ def _project_function(
     fvalues = _np.empty((codomain_dimension, npoints), dtype=projections.dtype)
     fun_result = _np.empty(codomain_dimension, dtype=projections.dtype)
     point = _np.empty(3, dtype=_np.float64)
+    normal = _np.empty(3, dtype=_np.float64)
 
     for index in support_elements:
 
@@ -829,12 +836,18 @@ def _project_function(
                 + points[1] * grid_data.vertices[j, grid_data.elements[2, index]]
             )
 
+        # The callable is invoked once per quadrature point, so pass it
+        # preallocated point and normal buffers instead of temporaries.
+        for j in range(3):
+            normal[j] = grid_data.normals[index, j] * normal_multipliers[index]
+
         for j in range(npoints):
-            point = global_points[:, j]
+            for k in range(3):
+                point[k] = global_points[k, j]
 
             fun(
                 point,
-                grid_data.normals[index] * normal_multipliers[index],
+                normal,
                 grid_data.domain_indices[index],
                 fun_result,
                 function_parameters,
@@ -168,3 +168,146 @@ class _SumPotentialOperator(PotentialOperator):
     def evaluation_points(self):
         """Return the evaluation points."""
         return self._op1.points
+
+
+class _MultiDensityPotentialOperator(PotentialOperator):
+    """
+    Potential operator that is applied to a tuple of grid functions.
+
+    Subclasses define how the densities are combined into the coefficient
+    array passed to the evaluator.
+    """
+
+    def __init__(self, potential_evaluator, alpha=1.0):
+        """Construct. Should not be called by the user."""
+        super().__init__(potential_evaluator)
+        self._alpha = alpha
+
+    def _coefficients(self, grid_funs):
+        """Return the evaluator coefficients for a tuple of grid functions."""
+        raise NotImplementedError
+
+    def _scaled(self, alpha):
+        """Return a copy of the operator scaled by alpha."""
+        raise NotImplementedError
+
+    def evaluate(self, *grid_funs):
+        """
+        Apply the potential operator to a tuple of grid functions.
+
+        Parameters
+        ----------
+        grid_funs : bempp.api.GridFunction
+            The boundary densities in the order expected by the
+            operator.
+
+        """
+        result = self._evaluator.evaluate(self._coefficients(grid_funs))
+        if self._alpha != 1.0:
+            result *= self._alpha
+        return result
+
+    def __add__(self, obj):
+        """Add."""
+        raise ValueError("Potential operators on several densities cannot be added.")
+
+    def __mul__(self, obj):
+        """Multiply."""
+        import numpy as np
+        from bempp.api import GridFunction
+
+        if isinstance(obj, (tuple, list)):
+            return self.evaluate(*obj)
+        elif np.isscalar(obj):
+            return self._scaled(self._alpha * obj)
+        elif isinstance(obj, GridFunction):
+            # Raises unless the operator expects a single density
+            return self.evaluate(obj)
+        else:
+            return NotImplemented
+
+    def __rmul__(self, obj):
+        """Reverse multiply."""
+        import numpy as np
+
+        if np.isscalar(obj):
+            return self.__mul__(obj)
+        else:
+            return NotImplemented
+
+
+class CombinedPotentialOperator(_MultiDensityPotentialOperator):
+    """
+    Potential operator that evaluates a pair of densities in a single pass.
+
+    The operator is applied to a pair (fun_m, fun_e) of grid functions
+    defined on space_m and space_e.
+
+    This class is not supposed to be instantiated directly.
+    """
+
+    def __init__(self, potential_evaluator, space_m, space_e, alpha=1.0):
+        """Construct. Should not be called by the user."""
+        super().__init__(potential_evaluator, alpha)
+        self._space_m = space_m
+        self._space_e = space_e
+
+    def _coefficients(self, grid_funs):
+        """Stack the magnetic and electric coefficients into two columns."""
+        import numpy as np
+
+        if len(grid_funs) != 2:
+            raise ValueError(f"Expected 2 grid functions, got {len(grid_funs)}.")
+
+        fun_m, fun_e = grid_funs
+        if fun_m.space != self._space_m or fun_e.space != self._space_e:
+            raise ValueError("Grid functions are not defined on the operator spaces.")
+
+        return np.stack([fun_m.coefficients, fun_e.coefficients], axis=1)
+
+    def _scaled(self, alpha):
+        """Return a copy of the operator scaled by alpha."""
+        return CombinedPotentialOperator(
+            self._evaluator, self._space_m, self._space_e, alpha
+        )
+
+
+class BatchedPotentialOperator(_MultiDensityPotentialOperator):
+    """
+    Potential operator that evaluates densities on several spaces in one pass.
+
+    The densities are mapped onto a single space defined over the union of
+    the underlying grids, so that the potential is assembled only once.
+    The operator is applied to a tuple of grid functions, one for each
+    space it was created with and in the same order.
+
+    This class is not supposed to be instantiated directly.
+    """
+
+    def __init__(self, op, spaces, coefficient_maps, alpha=1.0):
+        """Construct. Should not be called by the user."""
+        super().__init__(op._evaluator, alpha)
+        self._spaces = spaces
+        self._coefficient_maps = coefficient_maps
+
+    def _coefficients(self, grid_funs):
+        """Map the coefficients of all densities onto the union space."""
+        if len(grid_funs) != len(self._spaces):
+            raise ValueError(
+                f"Expected {len(self._spaces)} grid functions, "
+                + f"got {len(grid_funs)}."
+            )
+
+        if any(fun.space != space for fun, space in zip(grid_funs, self._spaces)):
+            raise ValueError("Grid functions are not defined on the operator spaces.")
+
+        return sum(
+            coefficient_map @ fun.coefficients
+            for coefficient_map, fun in zip(self._coefficient_maps, grid_funs)
+        )
+
+    def _scaled(self, alpha):
+        """Return a copy of the operator scaled by alpha."""
+        return BatchedPotentialOperator(
+            self, self._spaces, self._coefficient_maps, alpha
+        )
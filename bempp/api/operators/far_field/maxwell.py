@@ -22,7 +22,7 @@ def electric_field(
 
     operator_descriptor = OperatorDescriptor(
         "maxwell_far_field_electric_field_potential",  # Identifier
-        [_np.real(wavenumber), _np.imag(wavenumber)],  # Options
+        (_np.real(wavenumber), _np.imag(wavenumber)),  # Options
         "helmholtz_far_field_single_layer",  # Kernel type
         "maxwell_electric_far_field",  # Assembly type
         precision,  # Precision
@@ -58,7 +58,7 @@ def magnetic_field(
 
     operator_descriptor = OperatorDescriptor(
         "maxwell_far_field_magnetic_field_potential",  # Identifier
-        [_np.real(wavenumber), _np.imag(wavenumber)],  # Options
+        (_np.real(wavenumber), _np.imag(wavenumber)),  # Options
         "helmholtz_far_field_single_layer",  # Kernel type
         "maxwell_magnetic_far_field",  # Assembly type
         precision,  # Precision
@@ -74,6 +74,144 @@ def magnetic_field(
     )
 
 
+def electric_field_batched(
+    spaces,
+    points,
+    wavenumber,
+    parameters=None,
+    assembler="dense",
+    device_interface=None,
+    precision=None,
+    union_space=None,
+):
+    """
+    Return a Maxwell electric far-field potential operator over several spaces.
+
+    The spaces must be RWG spaces on disjoint grids. The returned
+    operator is applied to a tuple of grid functions, one for each space,
+    and returns the sum of the far-fields of all densities, evaluated over
+    an RWG space on the union of the grids.
+
+    This is an API convenience. The far-field cost is proportional to the
+    number of elements times the number of points either way, so batching
+    is not faster than summing separate evaluations, and building the union
+    space adds setup cost.
+
+    The RWG space over the union of the grids is available as the space
+    attribute of the returned operator. It can be passed as union_space
+    to further batched operators on the same grids to avoid rebuilding it.
+    """
+    from bempp.api.assembly.potential_operator import BatchedPotentialOperator
+
+    union_space, coefficient_maps = _rwg0_union_space(spaces, union_space)
+
+    return BatchedPotentialOperator(
+        electric_field(
+            union_space,
+            points,
+            wavenumber,
+            parameters,
+            assembler,
+            device_interface,
+            precision,
+        ),
+        spaces,
+        coefficient_maps,
+    )
+
+
+def magnetic_field_batched(
+    spaces,
+    points,
+    wavenumber,
+    parameters=None,
+    assembler="dense",
+    device_interface=None,
+    precision=None,
+    union_space=None,
+):
+    """
+    Return a Maxwell magnetic far-field potential operator over several spaces.
+
+    See electric_field_batched for details.
+    """
+    from bempp.api.assembly.potential_operator import BatchedPotentialOperator
+
+    union_space, coefficient_maps = _rwg0_union_space(spaces, union_space)
+
+    return BatchedPotentialOperator(
+        magnetic_field(
+            union_space,
+            points,
+            wavenumber,
+            parameters,
+            assembler,
+            device_interface,
+            precision,
+        ),
+        spaces,
+        coefficient_maps,
+    )
+
+
+def _rwg0_union_space(spaces, union_space=None):
+    """
+    Return an RWG space over the union of the grids of spaces.
+
+    Also returns for each space a sparse matrix that maps its coefficients
+    to coefficients of the union space. If union_space is given, it must
+    be an RWG space over the union of the grids in the same order and is
+    reused instead of building a new one.
+    """
+    from scipy.sparse import coo_matrix
+    from bempp.api import function_space
+    from bempp.api.grid.grid import union
+
+    for space in spaces:
+        if space.identifier != "rwg0":
+            raise ValueError("Batched far-field operators require RWG spaces.")
+        if space.number_of_support_elements != space.grid.number_of_elements or (
+            _np.any(space.normal_multipliers != 1)
+        ):
+            raise ValueError(
+                "Batched far-field operators require spaces with full support "
+                + "and unswapped normals."
+            )
+
+    if union_space is None:
+        union_space = function_space(union([space.grid for space in spaces]), "RWG", 0)
+    elif union_space.identifier != "rwg0" or (
+        union_space.grid.number_of_elements
+        != sum(space.grid.number_of_elements for space in spaces)
+    ):
+        raise ValueError("union_space must be an RWG space over the union of grids.")
+
+    coefficient_maps = []
+    element_offset = 0
+
+    for space in spaces:
+        nelements = space.grid.number_of_elements
+        union_elements = slice(element_offset, element_offset + nelements)
+        multipliers = (
+            space.local_multipliers * union_space.local_multipliers[union_elements]
+        ).ravel()
+        dofs = space.local2global.ravel()[multipliers != 0]
+        union_dofs = union_space.local2global[union_elements].ravel()[
+            multipliers != 0
+        ]
+        # Every dof appears once for each adjacent element.
+        dofs, first = _np.unique(dofs, return_index=True)
+        coefficient_maps.append(
+            coo_matrix(
+                (multipliers[multipliers != 0][first], (union_dofs[first], dofs)),
+                shape=(union_space.global_dof_count, space.global_dof_count),
+            ).tocsr()
+        )
+        element_offset += nelements
+
+    return union_space, coefficient_maps
+
+
 # def magnetic_field(
 # space, points, wavenumber, parameters=None, device_interface=None, precision=None
 # ):
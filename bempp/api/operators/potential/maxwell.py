@@ -25,7 +25,7 @@ def electric_field(
 
     operator_descriptor = OperatorDescriptor(
         "maxwell_electric_field_potential",  # Identifier
-        [_np.real(wavenumber), _np.imag(wavenumber)],  # Options
+        (_np.real(wavenumber), _np.imag(wavenumber)),  # Options
         "helmholtz_single_layer",  # Kernel type
         "maxwell_electric_field",  # Assembly type
         precision,  # Precision
@@ -64,7 +64,7 @@ def magnetic_field(
 
     operator_descriptor = OperatorDescriptor(
         "maxwell_magnetic_field_potential",  # Identifier
-        [_np.real(wavenumber), _np.imag(wavenumber)],  # Options
+        (_np.real(wavenumber), _np.imag(wavenumber)),  # Options
         "helmholtz_single_layer",  # Kernel type
         "maxwell_magnetic_field",  # Assembly type
         precision,  # Precision
@@ -78,3 +78,57 @@ def magnetic_field(
             space, points, operator_descriptor, device_interface, assembler, parameters
         )
     )
+
+
+def combined_field(
+    space_m,
+    space_e,
+    points,
+    wavenumber,
+    parameters=None,
+    assembler="dense",
+    device_interface=None,
+    precision=None,
+):
+    """
+    Return a combined Maxwell electric and magnetic field potential operator.
+
+    The electric and magnetic field potentials are evaluated in a single
+    pass, sharing the Green's function evaluations between them. The
+    resulting operator is applied to a pair (fun_m, fun_e) of grid functions
+    defined on space_m and space_e. The returned array has six rows: the
+    first three contain the electric field potential applied to fun_e
+    and the last three the magnetic field potential applied to fun_m.
+    """
+    from bempp.api.operators import OperatorDescriptor
+    from bempp.api.assembly.potential_operator import CombinedPotentialOperator
+    from bempp.api.assembly.assembler import PotentialAssembler
+    import bempp.api
+
+    if space_m.identifier != "rwg0" or space_e.identifier != "rwg0":
+        raise ValueError("Spaces must be RWG type function spaces.")
+
+    if not space_m.is_compatible(space_e):
+        raise ValueError("Spaces must be compatible.")
+
+    if precision is None:
+        precision = bempp.api.DEFAULT_PRECISION
+
+    operator_descriptor = OperatorDescriptor(
+        "maxwell_combined_field_potential",  # Identifier
+        (_np.real(wavenumber), _np.imag(wavenumber)),  # Options
+        "helmholtz_single_layer",  # Kernel type
+        "maxwell_combined_field",  # Assembly type
+        precision,  # Precision
+        True,  # Is complex
+        None,  # Singular part
+        6,  # Kernel dimension
+    )
+
+    return CombinedPotentialOperator(
+        PotentialAssembler(
+            space_e, points, operator_descriptor, device_interface, assembler, parameters
+        ),
+        space_m,
+        space_e,
+    )
@@ -47,6 +47,8 @@ class _DenseAssembly(object):
     def __init__(self):
         """Iniitalize dense assembly parameters."""
         self.workgroup_size_multiple = 2
+        self.potential_workgroup_size = 128
+        self.specialize_wavenumber = False
 
 
 class _Assembly(object):
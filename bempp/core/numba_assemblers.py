@@ -1,6 +1,14 @@
 """Actual implementation of Numba assemblers."""
 import numpy as _np
 
+# Potentials that the Numba assembler evaluates in the requested precision.
+# All other potentials are evaluated in double precision.
+SINGLE_PRECISION_POTENTIALS = (
+    "maxwell_electric_field",
+    "maxwell_magnetic_field",
+    "maxwell_combined_field",
+)
+
 
 def singular_assembler(
     device_interface,
@@ -133,9 +141,12 @@ def potential_assembler(
 
     quad_points, quad_weights = rule(parameters.quadrature.regular)
 
-    # Perform Numba assembly always in double precision
-    # precision = operator_descriptor.precision
-    precision = "double"
+    # Perform Numba assembly in double precision, except for the Maxwell
+    # potentials, whose kernels support single precision.
+    if operator_descriptor.assembly_type in SINGLE_PRECISION_POTENTIALS:
+        precision = operator_descriptor.precision
+    else:
+        precision = "double"
 
     dtype = _np.dtype(get_type(precision).real)
 
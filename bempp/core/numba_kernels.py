@@ -5,6 +5,14 @@ import numpy as _np
 
 M_INV_4PI = 1.0 / (4 * _np.pi)
 
+# Tile sizes for the evaluation of potentials. Each thread evaluates a block
+# of target points against one block of source quadrature points at a time,
+# so that both blocks stay in cache. POTENTIAL_TARGET_TILE is an upper bound;
+# smaller target blocks are used if there are too few to keep all threads busy.
+POTENTIAL_TARGET_TILE = 256
+POTENTIAL_SOURCE_TILE = 128
+POTENTIAL_TILES_PER_THREAD = 4
+
 
 def select_numba_kernels(operator_descriptor, mode="regular"):
     """Select the Numba kernels."""
@@ -29,6 +37,7 @@ def select_numba_kernels(operator_descriptor, mode="regular"):
         "default_scalar": default_scalar_potential_kernel,
         "maxwell_electric_field": maxwell_efield_potential,
         "maxwell_magnetic_field": maxwell_mfield_potential,
+        "maxwell_combined_field": maxwell_combined_field_potential,
         "maxwell_magnetic_far_field": maxwell_mfield_far_field,
         "maxwell_electric_far_field": maxwell_efield_far_field,
     }
@@ -343,22 +352,21 @@ def helmholtz_single_layer_regular(
     wavenumber_imag = kernel_parameters[1]
     npoints = trial_points.shape[1]
     dtype = trial_points.dtype
-    dist = _np.zeros(npoints, dtype=dtype)
-    output_real = _np.zeros(npoints, dtype=dtype)
-    output_imag = _np.zeros(npoints, dtype=dtype)
+    output_real = _np.empty(npoints, dtype=dtype)
+    output_imag = _np.empty(npoints, dtype=dtype)
     m_inv_4pi = dtype.type(M_INV_4PI)
-    for i in range(3):
-        for j in range(npoints):
-            dist[j] += (trial_points[i, j] - test_point[i]) ** 2
+    # Single pass over the trial points with one division and at most
+    # one exponential per point.
     for j in range(npoints):
-        dist[j] = _np.sqrt(dist[j])
-    for j in range(npoints):
-        output_real[j] = _np.cos(wavenumber_real * dist[j]) * m_inv_4pi / dist[j]
-        output_imag[j] = _np.sin(wavenumber_real * dist[j]) * m_inv_4pi / dist[j]
-    if wavenumber_imag != 0:
-        for j in range(npoints):
-            output_real[j] *= _np.exp(-wavenumber_imag * dist[j])
-            output_imag[j] *= _np.exp(-wavenumber_imag * dist[j])
+        diff0 = trial_points[0, j] - test_point[0]
+        diff1 = trial_points[1, j] - test_point[1]
+        diff2 = trial_points[2, j] - test_point[2]
+        dist = _np.sqrt(diff0 * diff0 + diff1 * diff1 + diff2 * diff2)
+        factor = m_inv_4pi / dist
+        if wavenumber_imag != 0:
+            factor *= _np.exp(-wavenumber_imag * dist)
+        output_real[j] = factor * _np.cos(wavenumber_real * dist)
+        output_imag[j] = factor * _np.sin(wavenumber_real * dist)
     return output_real + 1j * output_imag
 
 
@@ -2788,6 +2796,44 @@ def maxwell_mfield_regular_assembler(
                     )
 
 
+@_numba.jit(
+    nopython=True, parallel=False, error_model="numpy", fastmath=True, boundscheck=False
+)
+def _potential_target_tile_size(number_of_points):
+    """Return the number of target points evaluated by a thread at a time."""
+    number_of_tiles = POTENTIAL_TILES_PER_THREAD * _numba.get_num_threads()
+    tile_size = (number_of_points + number_of_tiles - 1) // number_of_tiles
+    return max(1, min(POTENTIAL_TARGET_TILE, tile_size))
+
+
+@_numba.jit(
+    nopython=True, parallel=False, error_model="numpy", fastmath=True, boundscheck=False
+)
+def _helmholtz_green_tile(
+    test_point, sources, wavenumber_real, wavenumber_imag, diff, dist, kernel_values
+):
+    """
+    Evaluate the Helmholtz Green's function between a point and a source tile.
+
+    The differences test_point - sources, the distances and the kernel values
+    are written into the preallocated buffers diff, dist and kernel_values.
+    """
+    m_inv_4pi = dist.dtype.type(M_INV_4PI)
+    for index in range(sources.shape[1]):
+        dist[index] = 0
+        for dim in range(3):
+            diff[dim, index] = test_point[dim] - sources[dim, index]
+            dist[index] += diff[dim, index] * diff[dim, index]
+        dist[index] = _np.sqrt(dist[index])
+        factor = m_inv_4pi / dist[index]
+        if wavenumber_imag != 0:
+            factor *= _np.exp(-wavenumber_imag * dist[index])
+        kernel_values[index] = factor * (
+            _np.cos(wavenumber_real * dist[index])
+            + 1j * _np.sin(wavenumber_real * dist[index])
+        )
+
+
 @_numba.jit(
     nopython=True, parallel=True, error_model="numpy", fastmath=True, boundscheck=False
 )
@@ -2851,31 +2897,51 @@ def maxwell_efield_potential(
                     2 * factor
                 )
 
-    for point_index in _numba.prange(number_of_points):
-        test_point = points[:, point_index].copy()
-
-        kernel_values = kernel_function(
-            test_point, global_points, None, None, kernel_parameters
-        )
-        diff = test_point.reshape(3, 1) - global_points
-        dist = _np.zeros(number_of_quad_points * n_support_elements, dtype=dtype)
-        for dim in range(3):
-            for index in range(number_of_quad_points * n_support_elements):
-                dist[index] += diff[dim, index] * diff[dim, index]
-        dist = _np.sqrt(dist)
-
-        for dim in range(kernel_dimension):
-            point_result = 0
-            for trial_index in range(number_of_quad_points * n_support_elements):
-                ldist = dist[trial_index]
-                point_result += kernel_values[trial_index] * (
-                    1j * wavenumber * tmp1[dim, trial_index]
-                    - diff[dim, trial_index]
-                    * (1j * wavenumber * ldist - 1)
-                    * tmp2[trial_index]
-                    / (1j * wavenumber * ldist * ldist)
+    number_of_sources = number_of_quad_points * n_support_elements
+    target_tile_size = _potential_target_tile_size(number_of_points)
+    number_of_target_tiles = (
+        number_of_points + target_tile_size - 1
+    ) // target_tile_size
+
+    for target_tile in _numba.prange(number_of_target_tiles):
+        target_start = target_tile * target_tile_size
+        target_end = min(target_start + target_tile_size, number_of_points)
+        targets = points[:, target_start:target_end].T.copy()
+        diff = _np.empty((3, POTENTIAL_SOURCE_TILE), dtype=dtype)
+        dist = _np.empty(POTENTIAL_SOURCE_TILE, dtype=dtype)
+        kernel_values = _np.empty(POTENTIAL_SOURCE_TILE, dtype=result_type)
+
+        for source_start in range(0, number_of_sources, POTENTIAL_SOURCE_TILE):
+            source_end = min(source_start + POTENTIAL_SOURCE_TILE, number_of_sources)
+            sources = global_points[:, source_start:source_end]
+
+            for target_index in range(target_end - target_start):
+                point_index = target_start + target_index
+                test_point = targets[target_index]
+
+                _helmholtz_green_tile(
+                    test_point,
+                    sources,
+                    kernel_parameters[0],
+                    kernel_parameters[1],
+                    diff,
+                    dist,
+                    kernel_values,
                 )
-            result[dim, point_index] = point_result
+
+                for dim in range(kernel_dimension):
+                    point_result = 0
+                    for index in range(source_end - source_start):
+                        trial_index = source_start + index
+                        ldist = dist[index]
+                        point_result += kernel_values[index] * (
+                            1j * wavenumber * tmp1[dim, trial_index]
+                            - diff[dim, index]
+                            * (1j * wavenumber * ldist - 1)
+                            * tmp2[trial_index]
+                            / (1j * wavenumber * ldist * ldist)
+                        )
+                    result[dim, point_index] += point_result
 
     return result
 
@@ -2939,36 +3005,202 @@ def maxwell_mfield_potential(
                     * grid_data.integration_elements[element]
                 )
 
-    for point_index in _numba.prange(number_of_points):
-        test_point = points[:, point_index].copy()
+    number_of_sources = number_of_quad_points * n_support_elements
+    target_tile_size = _potential_target_tile_size(number_of_points)
+    number_of_target_tiles = (
+        number_of_points + target_tile_size - 1
+    ) // target_tile_size
+
+    for target_tile in _numba.prange(number_of_target_tiles):
+        target_start = target_tile * target_tile_size
+        target_end = min(target_start + target_tile_size, number_of_points)
+        targets = points[:, target_start:target_end].T.copy()
+        diff = _np.empty((3, POTENTIAL_SOURCE_TILE), dtype=dtype)
+        dist = _np.empty(POTENTIAL_SOURCE_TILE, dtype=dtype)
+        kernel_values = _np.empty(POTENTIAL_SOURCE_TILE, dtype=result_type)
+
+        for source_start in range(0, number_of_sources, POTENTIAL_SOURCE_TILE):
+            source_end = min(source_start + POTENTIAL_SOURCE_TILE, number_of_sources)
+            sources = global_points[:, source_start:source_end]
+
+            for target_index in range(target_end - target_start):
+                point_index = target_start + target_index
+                test_point = targets[target_index]
+
+                _helmholtz_green_tile(
+                    test_point,
+                    sources,
+                    kernel_parameters[0],
+                    kernel_parameters[1],
+                    diff,
+                    dist,
+                    kernel_values,
+                )
 
-        kernel_values = kernel_function(
-            test_point, global_points, None, None, kernel_parameters
-        )
-        diff = test_point.reshape(3, 1) - global_points
-        dist = _np.zeros(number_of_quad_points * n_support_elements, dtype=dtype)
-        for dim in range(3):
-            for index in range(number_of_quad_points * n_support_elements):
-                dist[index] += diff[dim, index] * diff[dim, index]
-        dist = _np.sqrt(dist)
+                for index in range(source_end - source_start):
+                    trial_index = source_start + index
+                    ldist = dist[index]
+                    grad_factor = (
+                        kernel_values[index]
+                        * (1j * wavenumber * ldist - 1)
+                        / (ldist * ldist)
+                    )
+                    val0 = grad_factor * tmp[0, trial_index]
+                    val1 = grad_factor * tmp[1, trial_index]
+                    val2 = grad_factor * tmp[2, trial_index]
+                    result[0, point_index] += (
+                        diff[1, index] * val2 - diff[2, index] * val1
+                    )
+                    result[1, point_index] += (
+                        diff[2, index] * val0 - diff[0, index] * val2
+                    )
+                    result[2, point_index] += (
+                        diff[0, index] * val1 - diff[1, index] * val0
+                    )
 
-        for trial_index in range(number_of_quad_points * n_support_elements):
-            ldist = dist[trial_index]
-            val = (
-                kernel_values[trial_index]
-                * (1j * wavenumber * ldist - 1)
-                * tmp[:, trial_index]
-                / (ldist * ldist)
-            )
-            result[0, point_index] += (
-                diff[1, trial_index] * val[2] - diff[2, trial_index] * val[1]
-            )
-            result[1, point_index] += (
-                diff[2, trial_index] * val[0] - diff[0, trial_index] * val[2]
-            )
-            result[2, point_index] += (
-                diff[0, trial_index] * val[1] - diff[1, trial_index] * val[0]
-            )
+    return result
+
+
+@_numba.jit(
+    nopython=True, parallel=True, error_model="numpy", fastmath=True, boundscheck=False
+)
+def maxwell_combined_field_potential(
+    dtype,
+    result_type,
+    kernel_dimension,
+    points,
+    x,
+    grid_data,
+    quad_points,
+    quad_weights,
+    number_of_shape_functions,
+    shapeset_evaluate,
+    kernel_function,
+    kernel_parameters,
+    normal_multipliers,
+    support_elements,
+):
+    """
+    Implement the combined Maxwell electric and magnetic field potential.
+
+    The coefficients x are of shape (n, 2) with the magnetic density in the
+    first and the electric density in the second column. The first three rows
+    of the result contain the electric field, the last three rows the
+    magnetic field.
+    """
+    wavenumber = kernel_parameters[0] + 1j * kernel_parameters[1]
+    dtype = grid_data.vertices.dtype
+    result = _np.zeros((kernel_dimension, points.shape[1]), dtype=result_type)
+    n_support_elements = len(support_elements)
+    number_of_quad_points = len(quad_weights)
+    number_of_points = points.shape[1]
+
+    global_points = _np.zeros(
+        (3, number_of_quad_points * n_support_elements), dtype=dtype
+    )
+
+    basis_functions = get_piola_transform(grid_data, support_elements, quad_points)
+
+    edge_lengths = get_edge_lengths(grid_data, support_elements)
+
+    tmp1 = _np.zeros((3, number_of_quad_points * n_support_elements), dtype=result_type)
+    tmp2 = _np.zeros(number_of_quad_points * n_support_elements, dtype=result_type)
+    tmp3 = _np.zeros((3, number_of_quad_points * n_support_elements), dtype=result_type)
+
+    for element_index, element in enumerate(support_elements):
+        global_points[
+            :,
+            number_of_quad_points
+            * element_index : number_of_quad_points
+            * (1 + element_index),
+        ] = grid_data.local2global(element, quad_points)
+
+    for element_index, element in enumerate(support_elements):
+        for quad_point_index in range(number_of_quad_points):
+            for fun_index in range(number_of_shape_functions):
+                factor_m = (
+                    quad_weights[quad_point_index]
+                    * x[number_of_shape_functions * element + fun_index, 0]
+                    * edge_lengths[element_index, fun_index]
+                )
+                factor_e = (
+                    quad_weights[quad_point_index]
+                    * x[number_of_shape_functions * element + fun_index, 1]
+                    * edge_lengths[element_index, fun_index]
+                )
+                tmp1[:, number_of_quad_points * element_index + quad_point_index] += (
+                    factor_e
+                    * basis_functions[element_index, fun_index, :, quad_point_index]
+                    * grid_data.integration_elements[element]
+                )
+                tmp2[number_of_quad_points * element_index + quad_point_index] += (
+                    2 * factor_e
+                )
+                tmp3[:, number_of_quad_points * element_index + quad_point_index] += (
+                    factor_m
+                    * basis_functions[element_index, fun_index, :, quad_point_index]
+                    * grid_data.integration_elements[element]
+                )
+
+    number_of_sources = number_of_quad_points * n_support_elements
+    target_tile_size = _potential_target_tile_size(number_of_points)
+    number_of_target_tiles = (
+        number_of_points + target_tile_size - 1
+    ) // target_tile_size
+
+    for target_tile in _numba.prange(number_of_target_tiles):
+        target_start = target_tile * target_tile_size
+        target_end = min(target_start + target_tile_size, number_of_points)
+        targets = points[:, target_start:target_end].T.copy()
+        diff = _np.empty((3, POTENTIAL_SOURCE_TILE), dtype=dtype)
+        dist = _np.empty(POTENTIAL_SOURCE_TILE, dtype=dtype)
+        kernel_values = _np.empty(POTENTIAL_SOURCE_TILE, dtype=result_type)
+
+        for source_start in range(0, number_of_sources, POTENTIAL_SOURCE_TILE):
+            source_end = min(source_start + POTENTIAL_SOURCE_TILE, number_of_sources)
+            sources = global_points[:, source_start:source_end]
+
+            for target_index in range(target_end - target_start):
+                point_index = target_start + target_index
+                test_point = targets[target_index]
+
+                _helmholtz_green_tile(
+                    test_point,
+                    sources,
+                    kernel_parameters[0],
+                    kernel_parameters[1],
+                    diff,
+                    dist,
+                    kernel_values,
+                )
+
+                for index in range(source_end - source_start):
+                    trial_index = source_start + index
+                    ldist = dist[index]
+                    # Derivative of the Green's function, shared by both fields
+                    grad_factor = (
+                        kernel_values[index]
+                        * (1j * wavenumber * ldist - 1)
+                        / (ldist * ldist)
+                    )
+                    for dim in range(3):
+                        result[dim, point_index] += kernel_values[index] * (
+                            1j * wavenumber * tmp1[dim, trial_index]
+                        ) - grad_factor * diff[dim, index] * tmp2[trial_index] / (
+                            1j * wavenumber
+                        )
+                    val0 = grad_factor * tmp3[0, trial_index]
+                    val1 = grad_factor * tmp3[1, trial_index]
+                    val2 = grad_factor * tmp3[2, trial_index]
+                    result[3, point_index] += (
+                        diff[1, index] * val2 - diff[2, index] * val1
+                    )
+                    result[4, point_index] += (
+                        diff[2, index] * val0 - diff[0, index] * val2
+                    )
+                    result[5, point_index] += (
+                        diff[0, index] * val1 - diff[1, index] * val0
+                    )
 
     return result
 
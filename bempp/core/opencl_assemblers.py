@@ -6,7 +6,9 @@ import numpy as _np
 import pyopencl as _cl
 
 WORKGROUP_SIZE_GALERKIN = 16
-WORKGROUP_SIZE_POTENTIAL = 128
+
+# Potentials whose kernels can take the wavenumber as a compile time constant.
+WAVENUMBER_SPECIALIZED_POTENTIALS = ("maxwell_electric_field", "maxwell_combined_field")
 
 
 def singular_assembler(
@@ -358,14 +360,16 @@ def potential_assembler(
         get_vector_width,
     )
 
-    if bempp.api.POTENTIAL_OPERATOR_DEVICE_TYPE == "gpu":
-        device_type = "gpu"
-    elif bempp.api.POTENTIAL_OPERATOR_DEVICE_TYPE == "cpu":
-        device_type = "cpu"
+    # A device interface of the form "opencl_gpu" or "opencl_cpu" selects
+    # the device type for this operator only.
+    interface_options = device_interface.split("_")[1:]
+    if interface_options:
+        device_type = interface_options[0]
     else:
-        raise RuntimeError(
-            f"Unknown device type {bempp.api.POTENTIAL_OPERATOR_DEVICE_TYPE}"
-        )
+        device_type = bempp.api.POTENTIAL_OPERATOR_DEVICE_TYPE
+
+    if device_type not in ["cpu", "gpu"]:
+        raise RuntimeError(f"Unknown device type {device_type}")
 
     mf = _cl.mem_flags
     ctx = default_context(device_type)
@@ -388,7 +392,17 @@ def potential_assembler(
     nelements = len(indices)
     vector_width = get_vector_width(precision, device_type=device_type)
     npoints = points.shape[1]
-    remainder_size = nelements % WORKGROUP_SIZE_POTENTIAL
+
+    # Each work group sums the contributions of workgroup_size elements
+    # to one evaluation point.
+    workgroup_size = parameters.assembly.dense.potential_workgroup_size
+    if workgroup_size % vector_width != 0:
+        raise ValueError(
+            f"Potential workgroup size {workgroup_size} must be a multiple "
+            + f"of the vector width {vector_width}."
+        )
+
+    remainder_size = nelements % workgroup_size
     main_size = nelements - remainder_size
 
     main_kernel = None
@@ -399,7 +413,7 @@ def potential_assembler(
         "NUMBER_OF_QUAD_POINTS": len(quad_weights),
         "SHAPESET": space.shapeset.identifier,
         "NUMBER_OF_SHAPE_FUNCTIONS": space.number_of_shape_functions,
-        "WORKGROUP_SIZE": WORKGROUP_SIZE_POTENTIAL // vector_width,
+        "WORKGROUP_SIZE": workgroup_size // vector_width,
     }
 
     if operator_descriptor.is_complex:
@@ -407,19 +421,30 @@ def potential_assembler(
         options["COMPLEX_COEFFICIENTS"] = None
         options["COMPLEX_RESULT"] = None
 
+    # Compile the wavenumber into the potential kernels as a constant. Each
+    # distinct wavenumber builds its own program, which is then cached. The
+    # sum kernel does not depend on the wavenumber and keeps the plain options.
+    potential_options = dict(options)
+    if (
+        parameters.assembly.dense.specialize_wavenumber
+        and operator_descriptor.assembly_type in WAVENUMBER_SPECIALIZED_POTENTIALS
+    ):
+        potential_options["WAVENUMBER_REAL"] = float(kernel_options[0])
+        potential_options["WAVENUMBER_IMAG"] = float(kernel_options[1])
+
     if main_size > 0:
         main_kernel = get_kernel_from_operator_descriptor(
-            operator_descriptor, options, "potential", device_type=device_type
+            operator_descriptor, potential_options, "potential", device_type=device_type
         )
         sum_kernel = get_kernel_from_name(
             "sum_for_potential_novec", options, precision, device_type=device_type
         )
 
     if remainder_size > 0:
-        options["WORKGROUP_SIZE"] = remainder_size
+        potential_options["WORKGROUP_SIZE"] = remainder_size
         remainder_kernel = get_kernel_from_operator_descriptor(
             operator_descriptor,
-            options,
+            potential_options,
             "potential",
             force_novec=True,
             device_type=device_type,
@@ -431,10 +456,13 @@ def potential_assembler(
         ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=space.normal_multipliers
     )
 
+    # The kernels read the coordinates of each point contiguously. Convert
+    # and reorder in a single copy, or none if points is already Fortran
+    # ordered in the right precision.
     points_buffer = _cl.Buffer(
         ctx,
         mf.READ_ONLY | mf.COPY_HOST_PTR,
-        hostbuf=points.ravel(order="F").astype(dtype),
+        hostbuf=_np.asfortranarray(points, dtype=dtype).ravel(order="F"),
     )
 
     grid_buffer = _cl.Buffer(
@@ -461,15 +489,11 @@ def potential_assembler(
         ctx, mf.READ_WRITE, size=result_type.itemsize * kernel_dimension * npoints
     )
 
-    coefficients_buffer = _cl.Buffer(
-        ctx, mf.READ_ONLY, size=result_type.itemsize * space.map_to_full_grid.shape[0]
-    )
-
     if main_size > 0:
         sum_size = (
             kernel_dimension
             * npoints
-            * (nelements // WORKGROUP_SIZE_POTENTIAL)
+            * (nelements // workgroup_size)
             * result_type.itemsize
         )
         sum_buffer = _cl.Buffer(ctx, mf.READ_WRITE, size=sum_size)
@@ -487,8 +511,15 @@ def potential_assembler(
         """Evaluate a potential."""
         result = _np.empty(kernel_dimension * npoints, dtype=result_type)
 
+        # Combined potentials pass one column of coefficients per density,
+        # so the buffer size is only known here.
+        coefficients_buffer = _cl.Buffer(
+            ctx,
+            mf.READ_ONLY | mf.COPY_HOST_PTR,
+            hostbuf=_np.ascontiguousarray(x, dtype=result_type),
+        )
+
         with _cl.CommandQueue(ctx, device=device) as queue:
-            _cl.enqueue_copy(queue, coefficients_buffer, x.astype(result_type))
             _cl.enqueue_fill_buffer(
                 queue,
                 result_buffer,
@@ -504,7 +535,7 @@ def potential_assembler(
                 main_kernel(
                     queue,
                     (npoints, main_size // vector_width),
-                    (1, WORKGROUP_SIZE_POTENTIAL // vector_width),
+                    (1, workgroup_size // vector_width),
                     grid_buffer,
                     indices_buffer,
                     normals_buffer,
@@ -522,7 +553,7 @@ def potential_assembler(
                     (1,),
                     sum_buffer,
                     result_buffer,
-                    _np.uint32(nelements // WORKGROUP_SIZE_POTENTIAL),
+                    _np.uint32(nelements // workgroup_size),
                 )
 
             if remainder_size > 0:
@@ -2,6 +2,7 @@
 
 import pyopencl as _cl
 import os as _os
+from collections import OrderedDict as _OrderedDict
 
 _CURRENT_PATH = _os.path.dirname(_os.path.realpath(__file__))
 _INCLUDE_PATH = _os.path.abspath(_os.path.join(_CURRENT_PATH, "./sources/include"))
@@ -13,6 +14,12 @@ _DEFAULT_CPU_CONTEXT = None
 _DEFAULT_GPU_DEVICE = None
 _DEFAULT_GPU_CONTEXT = None
 
+# Compiled programs, keyed by kernel file, compile options and context. The
+# compile options contain per-grid and per-wavenumber values, so the cache is
+# bounded and evicts the least recently used program.
+_PROGRAM_CACHE = _OrderedDict()
+_PROGRAM_CACHE_SIZE = 64
+
 
 def select_cl_kernel(operator_descriptor, mode):
     """Select OpenCL kernel."""
@@ -38,6 +45,7 @@ def select_cl_kernel(operator_descriptor, mode):
         "default_scalar": "evaluate_scalar_potential",
         "maxwell_electric_field": "evaluate_electric_field_potential",
         "maxwell_magnetic_field": "evaluate_magnetic_field_potential",
+        "maxwell_combined_field": "evaluate_maxwell_combined_field_potential",
         "maxwell_electric_far_field": "evaluate_maxwell_electric_far_field",
         "maxwell_magnetic_far_field": "evaluate_maxwell_magnetic_far_field",
     }
@@ -117,14 +125,24 @@ def build_program(assembly_function, options, precision, device_type="cpu"):
     file_name = assembly_function + ".cl"
     kernel_file = _os.path.join(_KERNEL_PATH, file_name)
 
-    kernel_string = open(kernel_file).read()
     kernel_options = get_kernel_compile_options(options, precision)
+    context = default_context(device_type)
 
-    return (
-        _cl.Program(default_context(device_type), kernel_string)
-        .build(options=kernel_options)
-        .kernel_function
-    )
+    key = (file_name, tuple(kernel_options), context.int_ptr)
+
+    if key in _PROGRAM_CACHE:
+        _PROGRAM_CACHE.move_to_end(key)
+    else:
+        kernel_string = open(kernel_file).read()
+        _PROGRAM_CACHE[key] = _cl.Program(context, kernel_string).build(
+            options=kernel_options
+        )
+        if len(_PROGRAM_CACHE) > _PROGRAM_CACHE_SIZE:
+            _PROGRAM_CACHE.popitem(last=False)
+
+    # Each call returns a new kernel object so that kernel arguments
+    # are not shared between different assemblers.
+    return _cl.Kernel(_PROGRAM_CACHE[key], "kernel_function")
 
 
 def get_kernel_from_operator_descriptor(
@@ -14,6 +14,20 @@
 
 #define KERNEL_EXPLICIT(kernel_name, modus) EVALUATOR(kernel_name, modus)
 
+/* Real and imaginary part of the Helmholtz wavenumber. If the wavenumber
+   is passed at compile time it is a constant that the compiler can fold
+   into the Green's function evaluation. Otherwise it is read from the
+   kernel parameters at run time.
+*/
+
+#ifdef WAVENUMBER_REAL
+#define WAVENUMBER_RE ((REALTYPE)(WAVENUMBER_REAL))
+#define WAVENUMBER_IM ((REALTYPE)(WAVENUMBER_IMAG))
+#else
+#define WAVENUMBER_RE kernel_parameters[0]
+#define WAVENUMBER_IM kernel_parameters[1]
+#endif
+
 /* Definition of constants needed in the kernels.
    They must not be left undefined if not defined
    externally. Otherwise, it will lead to compilation
@@ -472,13 +486,13 @@ inline void helmholtz_single_layer_novec(const REALTYPE3 testGlobalPoint,
                                            REALTYPE* result)
 {
     REALTYPE dist = distance(testGlobalPoint, trialGlobalPoint);
-    result[0] = M_INV_4PI * cos(kernel_parameters[0] * dist) / dist;
-    result[1] = M_INV_4PI * sin(kernel_parameters[0] * dist) / dist;
+    REALTYPE factor = M_INV_4PI / dist;
 
-    if (kernel_parameters[1] != M_ZERO) {
-        result[0] *= exp(-kernel_parameters[1] * dist);
-        result[1] *= exp(-kernel_parameters[1] * dist);
-    }
+    if (kernel_parameters[1] != M_ZERO)
+        factor *= exp(-kernel_parameters[1] * dist);
+
+    result[1] = factor * sincos(kernel_parameters[0] * dist, &result[0]);
+    result[0] *= factor;
 }
 
 inline void helmholtz_single_layer_vec4(const REALTYPE3 testGlobalPoint, 
@@ -490,16 +504,17 @@ inline void helmholtz_single_layer_vec4(const REALTYPE3 testGlobalPoint,
 {
     REALTYPE4 diff[3];
     REALTYPE4 dist;
+    REALTYPE4 factor;
 
     diff_vec4(testGlobalPoint, trialGlobalPoint, diff);
     dist = sqrt(diff[0] * diff[0] + diff[1] * diff[1] + diff[2] * diff[2]);
-    result[0] = M_INV_4PI * cos(kernel_parameters[0] * dist) / dist;
-    result[1] = M_INV_4PI * sin(kernel_parameters[0] * dist) / dist;
+    factor = M_INV_4PI / dist;
 
-    if (kernel_parameters[1] != M_ZERO) {
-        result[0] *= exp(-kernel_parameters[1] * dist);
-        result[1] *= exp(-kernel_parameters[1] * dist);
-    }
+    if (kernel_parameters[1] != M_ZERO)
+        factor *= exp(-kernel_parameters[1] * dist);
+
+    result[1] = factor * sincos(kernel_parameters[0] * dist, &result[0]);
+    result[0] *= factor;
 
 }
 
@@ -512,16 +527,17 @@ inline void helmholtz_single_layer_vec8(const REALTYPE3 testGlobalPoint,
 {
     REALTYPE8 diff[3];
     REALTYPE8 dist;
+    REALTYPE8 factor;
 
     diff_vec8(testGlobalPoint, trialGlobalPoint, diff);
     dist = sqrt(diff[0] * diff[0] + diff[1] * diff[1] + diff[2] * diff[2]);
-    result[0] = M_INV_4PI * cos(kernel_parameters[0] * dist) / dist;
-    result[1] = M_INV_4PI * sin(kernel_parameters[0] * dist) / dist;
+    factor = M_INV_4PI / dist;
 
-    if (kernel_parameters[1] != M_ZERO) {
-        result[0] *= exp(-kernel_parameters[1] * dist);
-        result[1] *= exp(-kernel_parameters[1] * dist);
-    }
+    if (kernel_parameters[1] != M_ZERO)
+        factor *= exp(-kernel_parameters[1] * dist);
+
+    result[1] = factor * sincos(kernel_parameters[0] * dist, &result[0]);
+    result[0] *= factor;
 
 }
 
@@ -534,16 +550,17 @@ inline void helmholtz_single_layer_vec16(const REALTYPE3 testGlobalPoint,
 {
     REALTYPE16 diff[3];
     REALTYPE16 dist;
+    REALTYPE16 factor;
 
     diff_vec16(testGlobalPoint, trialGlobalPoint, diff);
     dist = sqrt(diff[0] * diff[0] + diff[1] * diff[1] + diff[2] * diff[2]);
-    result[0] = M_INV_4PI * cos(kernel_parameters[0] * dist) / dist;
-    result[1] = M_INV_4PI * sin(kernel_parameters[0] * dist) / dist;
+    factor = M_INV_4PI / dist;
 
-    if (kernel_parameters[1] != M_ZERO) {
-        result[0] *= exp(-kernel_parameters[1] * dist);
-        result[1] *= exp(-kernel_parameters[1] * dist);
-    }
+    if (kernel_parameters[1] != M_ZERO)
+        factor *= exp(-kernel_parameters[1] * dist);
+
+    result[1] = factor * sincos(kernel_parameters[0] * dist, &result[0]);
+    result[0] *= factor;
 
 }
 
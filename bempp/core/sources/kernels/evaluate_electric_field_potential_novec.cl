@@ -30,6 +30,8 @@ __kernel void kernel_function(
   REALTYPE3 diff;
 
   REALTYPE dist;
+  REALTYPE invDist;
+  REALTYPE kernelFactor;
 
   REALTYPE2 point;
 
@@ -66,8 +68,8 @@ __kernel void kernel_function(
   }
 
 // Computation of 1i * wavenumber and 1 / (1i * wavenumber)
-  shiftedWavenumber[0] = -kernel_parameters[1];
-  shiftedWavenumber[1] = kernel_parameters[0];
+  shiftedWavenumber[0] = -WAVENUMBER_IM;
+  shiftedWavenumber[1] = WAVENUMBER_RE;
 
   inverseShiftedWavenumber[0] = M_ONE /
                                 (shiftedWavenumber[0] * shiftedWavenumber[0] +
@@ -104,22 +106,23 @@ __kernel void kernel_function(
     dist = distance(evalGlobalPoint, surfaceGlobalPoint);
     diff = evalGlobalPoint - surfaceGlobalPoint;
 
-    kernelValue[0] = M_INV_4PI * cos(kernel_parameters[0] * dist) / dist;
-    kernelValue[1] = M_INV_4PI * sin(kernel_parameters[0] * dist) / dist;
+    invDist = M_ONE / dist;
+    kernelFactor = M_INV_4PI * invDist;
+    if (WAVENUMBER_IM != M_ZERO)
+      kernelFactor *= exp(-WAVENUMBER_IM * dist);
 
-    if (kernel_parameters[1] != M_ZERO){
-      kernelValue[0] *= exp(-kernel_parameters[1] * dist);
-      kernelValue[1] *= exp(-kernel_parameters[1] * dist);
-    }
+    kernelValue[1] = sincos(WAVENUMBER_RE * dist, &kernelValue[0]);
+    kernelValue[0] *= kernelFactor;
+    kernelValue[1] *= kernelFactor;
 
-    factor1[0] = kernelValue[0] / (dist * dist);
-    factor1[1] = kernelValue[1] / (dist * dist);
+    factor1[0] = kernelValue[0] * invDist * invDist;
+    factor1[1] = kernelValue[1] * invDist * invDist;
 
     factor2[0] = -M_ONE;
-    factor2[1] = kernel_parameters[0] * dist;
+    factor2[1] = WAVENUMBER_RE * dist;
 
-    if (kernel_parameters[1] != M_ZERO)
-      factor2[0] += -kernel_parameters[1] * dist;
+    if (WAVENUMBER_IM != M_ZERO)
+      factor2[0] += -WAVENUMBER_IM * dist;
 
 
     product[0] = (factor1[0] * factor2[0] - factor1[1] * factor2[1]);
@@ -68,6 +68,8 @@ __kernel __attribute__((vec_type_hint(REALTYPEVEC))) void kernel_function(
   REALTYPEVEC diff[3];
 
   REALTYPEVEC dist;
+  REALTYPEVEC invDist;
+  REALTYPEVEC kernelFactor;
 
   REALTYPE2 point;
 
@@ -204,8 +206,8 @@ for (int index = 0; index < NUMBER_OF_SHAPE_FUNCTIONS; ++index){
   }
 
 // Computation of 1i * wavenumber and 1 / (1i * wavenumber)
-  shiftedWavenumber[0] = -kernel_parameters[1];
-  shiftedWavenumber[1] = kernel_parameters[0];
+  shiftedWavenumber[0] = -WAVENUMBER_IM;
+  shiftedWavenumber[1] = WAVENUMBER_RE;
 
   inverseShiftedWavenumber[0] = M_ONE /
                                 (shiftedWavenumber[0] * shiftedWavenumber[0] +
@@ -242,22 +244,23 @@ for (int index = 0; index < NUMBER_OF_SHAPE_FUNCTIONS; ++index){
     diff_vec(evalGlobalPoint, surfaceGlobalPoint, diff);
     dist = sqrt(diff[0] * diff[0] + diff[1] * diff[1] + diff[2] * diff[2]);
 
-    kernelValue[0] = M_INV_4PI * cos(kernel_parameters[0] * dist) / dist;
-    kernelValue[1] = M_INV_4PI * sin(kernel_parameters[0] * dist) / dist;
+    invDist = M_ONE / dist;
+    kernelFactor = M_INV_4PI * invDist;
+    if (WAVENUMBER_IM != M_ZERO)
+      kernelFactor *= exp(-WAVENUMBER_IM * dist);
 
-    if (kernel_parameters[1] != M_ZERO){
-      kernelValue[0] *= exp(-kernel_parameters[1] * dist);
-      kernelValue[1] *= exp(-kernel_parameters[1] * dist);
-    }
+    kernelValue[1] = sincos(WAVENUMBER_RE * dist, &kernelValue[0]);
+    kernelValue[0] *= kernelFactor;
+    kernelValue[1] *= kernelFactor;
 
-    factor1[0] = kernelValue[0] / (dist * dist);
-    factor1[1] = kernelValue[1] / (dist * dist);
+    factor1[0] = kernelValue[0] * invDist * invDist;
+    factor1[1] = kernelValue[1] * invDist * invDist;
 
     factor2[0] = -M_ONE;
-    factor2[1] = kernel_parameters[0] * dist;
+    factor2[1] = WAVENUMBER_RE * dist;
 
-    if (kernel_parameters[1] != M_ZERO)
-      factor2[0] += -kernel_parameters[1] * dist;
+    if (WAVENUMBER_IM != M_ZERO)
+      factor2[0] += -WAVENUMBER_IM * dist;
 
 
     product[0] = (factor1[0] * factor2[0] - factor1[1] * factor2[1]);
@@ -0,0 +1,240 @@
+#include "bempp_base_types.h"
+#include "bempp_helpers.h"
+#include "bempp_spaces.h"
+#include "kernels.h"
+
+// Combined evaluation of the Maxwell electric and magnetic field potentials.
+// The coefficients are interleaved per dof as (magnetic, electric) pairs. The
+// result contains the electric field in the first three and the magnetic
+// field in the last three components of each evaluation point.
+
+__kernel __attribute__((vec_type_hint(REALTYPEVEC))) void kernel_function(
+    __global REALTYPE *grid, __global uint *indices, __global int *normalSigns,
+    __global REALTYPE *evalPoints, __global REALTYPE *coefficients,
+    __constant REALTYPE *quadPoints, __constant REALTYPE *quadWeights,
+    __global REALTYPE *globalResult, __global REALTYPE *kernel_parameters) {
+  size_t gid[2];
+
+  gid[0] = get_global_id(0);
+  gid[1] = get_global_id(1);
+
+  size_t lid = get_local_id(1);
+  size_t groupId = get_group_id(1);
+  size_t numGroups = get_num_groups(1);
+
+  size_t elementIndex[VEC_LENGTH];
+
+  REALTYPEVEC surfaceGlobalPoint[3];
+
+  REALTYPE basisValue[3][2];
+  REALTYPEVEC elementValue[3][3];
+
+  REALTYPEVEC corners[3][3];
+  REALTYPEVEC jacobian[2][3];
+  REALTYPEVEC normal[3];
+  REALTYPEVEC diff[3];
+
+  REALTYPEVEC dist;
+  REALTYPEVEC invDist;
+  REALTYPEVEC kernelFactor;
+
+  REALTYPE2 point;
+
+  REALTYPEVEC intElem;
+  REALTYPEVEC twiceInvIntElem;
+
+  size_t quadIndex;
+  size_t coefficientIndex;
+  size_t i, j, k;
+  int vecIndex;
+
+  REALTYPEVEC electricIntegral[3][3][2];
+  REALTYPEVEC magneticIntegral[3][3][2];
+  REALTYPE shiftedWavenumber[2] = {M_ZERO, M_ZERO};
+  REALTYPE inverseShiftedWavenumber[2] = {M_ZERO, M_ZERO};
+
+  __local REALTYPEVEC localResult[WORKGROUP_SIZE][6][2];
+  REALTYPEVEC kernelValue[2];
+  REALTYPEVEC gradKernelValue[3][2];
+
+  REALTYPEVEC tempResult[3][3][2];
+  REALTYPEVEC magneticCoefficients[NUMBER_OF_SHAPE_FUNCTIONS][2];
+  REALTYPEVEC electricCoefficients[NUMBER_OF_SHAPE_FUNCTIONS][2];
+
+  REALTYPEVEC product[2];
+  REALTYPEVEC factor1[2];
+  REALTYPEVEC factor2[2];
+
+  REALTYPEVEC edgeLengths[3];
+
+  REALTYPE3 evalGlobalPoint =
+      (REALTYPE3)(evalPoints[3 * gid[0] + 0], evalPoints[3 * gid[0] + 1],
+                  evalPoints[3 * gid[0] + 2]);
+
+  for (vecIndex = 0; vecIndex < VEC_LENGTH; ++vecIndex)
+    elementIndex[vecIndex] = indices[VEC_LENGTH * gid[1] + vecIndex];
+
+  for (i = 0; i < NUMBER_OF_SHAPE_FUNCTIONS; ++i)
+    for (vecIndex = 0; vecIndex < VEC_LENGTH; ++vecIndex) {
+      coefficientIndex =
+          4 * (NUMBER_OF_SHAPE_FUNCTIONS * elementIndex[vecIndex] + i);
+      ((REALTYPE *)(&magneticCoefficients[i][0]))[vecIndex] =
+          coefficients[coefficientIndex];
+      ((REALTYPE *)(&magneticCoefficients[i][1]))[vecIndex] =
+          coefficients[coefficientIndex + 1];
+      ((REALTYPE *)(&electricCoefficients[i][0]))[vecIndex] =
+          coefficients[coefficientIndex + 2];
+      ((REALTYPE *)(&electricCoefficients[i][1]))[vecIndex] =
+          coefficients[coefficientIndex + 3];
+    }
+
+// Computation of 1i * wavenumber and 1 / (1i * wavenumber)
+  shiftedWavenumber[0] = -WAVENUMBER_IM;
+  shiftedWavenumber[1] = WAVENUMBER_RE;
+
+  inverseShiftedWavenumber[0] = M_ONE /
+                                (shiftedWavenumber[0] * shiftedWavenumber[0] +
+                                 shiftedWavenumber[1] * shiftedWavenumber[1]) *
+                                shiftedWavenumber[0];
+  inverseShiftedWavenumber[1] = -M_ONE /
+                                (shiftedWavenumber[0] * shiftedWavenumber[0] +
+                                 shiftedWavenumber[1] * shiftedWavenumber[1]) *
+                                shiftedWavenumber[1];
+
+  for (i = 0; i < 3; ++i)
+    for (j = 0; j < 3; ++j) {
+      electricIntegral[i][j][0] = M_ZERO;
+      electricIntegral[i][j][1] = M_ZERO;
+      magneticIntegral[i][j][0] = M_ZERO;
+      magneticIntegral[i][j][1] = M_ZERO;
+    }
+
+  getCornersVec(grid, elementIndex, corners);
+  getJacobianVec(corners, jacobian);
+  getNormalAndIntegrationElementVec(jacobian, normal, &intElem);
+
+  updateNormalsVec(elementIndex, normalSigns, normal);
+
+  computeEdgeLengthVec(corners, edgeLengths);
+
+  twiceInvIntElem = M_TWO / intElem;
+
+  for (quadIndex = 0; quadIndex < NUMBER_OF_QUAD_POINTS; ++quadIndex) {
+    point =
+        (REALTYPE2)(quadPoints[2 * quadIndex], quadPoints[2 * quadIndex + 1]);
+    getGlobalPointVec(corners, &point, surfaceGlobalPoint);
+    BASIS(SHAPESET, evaluate)(&point, &basisValue[0][0]);
+    getPiolaTransformVec(intElem, jacobian, basisValue, elementValue);
+
+    diff_vec(evalGlobalPoint, surfaceGlobalPoint, diff);
+    dist = sqrt(diff[0] * diff[0] + diff[1] * diff[1] + diff[2] * diff[2]);
+
+    invDist = M_ONE / dist;
+    kernelFactor = M_INV_4PI * invDist;
+    if (WAVENUMBER_IM != M_ZERO)
+      kernelFactor *= exp(-WAVENUMBER_IM * dist);
+
+    kernelValue[1] = sincos(WAVENUMBER_RE * dist, &kernelValue[0]);
+    kernelValue[0] *= kernelFactor;
+    kernelValue[1] *= kernelFactor;
+
+    factor1[0] = kernelValue[0] * invDist * invDist;
+    factor1[1] = kernelValue[1] * invDist * invDist;
+
+    factor2[0] = -M_ONE;
+    factor2[1] = WAVENUMBER_RE * dist;
+
+    if (WAVENUMBER_IM != M_ZERO)
+      factor2[0] += -WAVENUMBER_IM * dist;
+
+
+    product[0] = (factor1[0] * factor2[0] - factor1[1] * factor2[1]);
+    product[1] = (factor1[0] * factor2[1] + factor1[1] * factor2[0]);
+
+    gradKernelValue[0][0] = product[0] * diff[0];
+    gradKernelValue[0][1] = product[1] * diff[0];
+    gradKernelValue[1][0] = product[0] * diff[1];
+    gradKernelValue[1][1] = product[1] * diff[1];
+    gradKernelValue[2][0] = product[0] * diff[2];
+    gradKernelValue[2][1] = product[1] * diff[2];
+
+    factor1[0] = CMP_MULT_REAL(shiftedWavenumber, kernelValue);
+    factor1[1] = CMP_MULT_IMAG(shiftedWavenumber, kernelValue);
+
+    for (i = 0; i < 3; ++i) {
+      tempResult[i][0][0] = factor1[0] * elementValue[i][0];
+      tempResult[i][0][1] = factor1[1] * elementValue[i][0];
+      tempResult[i][1][0] = factor1[0] * elementValue[i][1];
+      tempResult[i][1][1] = factor1[1] * elementValue[i][1];
+      tempResult[i][2][0] = factor1[0] * elementValue[i][2];
+      tempResult[i][2][1] = factor1[1] * elementValue[i][2];
+    }
+
+    for (i = 0; i < 3; ++i)
+      for (j = 0; j < 3; ++j) {
+        tempResult[i][j][0] -=
+            CMP_MULT_REAL(inverseShiftedWavenumber, gradKernelValue[j]) *
+            twiceInvIntElem;
+        tempResult[i][j][1] -=
+            CMP_MULT_IMAG(inverseShiftedWavenumber, gradKernelValue[j]) *
+            twiceInvIntElem;
+      }
+
+    for (i = 0; i < 3; ++i)
+      for (j = 0; j < 3; ++j) {
+        electricIntegral[i][j][0] += tempResult[i][j][0] * quadWeights[quadIndex];
+        electricIntegral[i][j][1] += tempResult[i][j][1] * quadWeights[quadIndex];
+      }
+
+    for (i = 0; i < 3; ++i)
+      for (k = 0; k < 2; ++k) {
+        magneticIntegral[i][0][k] += (gradKernelValue[1][k] * elementValue[i][2] -
+                                      gradKernelValue[2][k] * elementValue[i][1]) *
+                                     quadWeights[quadIndex];
+        magneticIntegral[i][1][k] += (gradKernelValue[2][k] * elementValue[i][0] -
+                                      gradKernelValue[0][k] * elementValue[i][2]) *
+                                     quadWeights[quadIndex];
+        magneticIntegral[i][2][k] += (gradKernelValue[0][k] * elementValue[i][1] -
+                                      gradKernelValue[1][k] * elementValue[i][0]) *
+                                     quadWeights[quadIndex];
+      }
+  }
+
+  for (j = 0; j < 3; ++j) {
+    factor1[0] = M_ZERO;
+    factor1[1] = M_ZERO;
+    factor2[0] = M_ZERO;
+    factor2[1] = M_ZERO;
+    for (i = 0; i < 3; ++i) {
+      factor1[0] += CMP_MULT_REAL(electricIntegral[i][j], electricCoefficients[i]) *
+                    edgeLengths[i];
+      factor1[1] += CMP_MULT_IMAG(electricIntegral[i][j], electricCoefficients[i]) *
+                    edgeLengths[i];
+      factor2[0] += CMP_MULT_REAL(magneticIntegral[i][j], magneticCoefficients[i]) *
+                    edgeLengths[i];
+      factor2[1] += CMP_MULT_IMAG(magneticIntegral[i][j], magneticCoefficients[i]) *
+                    edgeLengths[i];
+    }
+    localResult[lid][j][0] = factor1[0] * intElem;
+    localResult[lid][j][1] = factor1[1] * intElem;
+    localResult[lid][3 + j][0] = factor2[0] * intElem;
+    localResult[lid][3 + j][1] = factor2[1] * intElem;
+  }
+
+  barrier(CLK_LOCAL_MEM_FENCE);
+
+  if (lid == 0) {
+    for (i = 1; i < WORKGROUP_SIZE; ++i)
+      for (j = 0; j < 6; ++j) {
+        localResult[0][j][0] += localResult[i][j][0];
+        localResult[0][j][1] += localResult[i][j][1];
+      }
+    for (vecIndex = 0; vecIndex < VEC_LENGTH; ++vecIndex)
+      for (j = 0; j < 6; ++j) {
+        globalResult[2 * ((6 * gid[0] + j) * numGroups + groupId)] +=
+            ((__local REALTYPE *)(&localResult[0][j][0]))[vecIndex];
+        globalResult[2 * ((6 * gid[0] + j) * numGroups + groupId) + 1] +=
+            ((__local REALTYPE *)(&localResult[0][j][1]))[vecIndex];
+      }
+  }
+}
@@ -0,0 +1,58 @@
+"""Unit tests for the OpenCL program cache."""
+
+import collections
+
+import pytest
+import bempp.api
+
+pytestmark = pytest.mark.skipif(
+    not bempp.api.CPU_OPENCL_DRIVER_FOUND, reason="No OpenCL CPU driver found."
+)
+
+
+@pytest.fixture
+def program_cache(monkeypatch):
+    """Replace the program cache by an empty one for the duration of a test."""
+    from bempp.core import opencl_kernels
+
+    cache = collections.OrderedDict()
+    monkeypatch.setattr(opencl_kernels, "_PROGRAM_CACHE", cache)
+    return cache
+
+
+def test_program_cache_shares_programs(program_cache):
+    """Test that equal options share a program but not the kernel object."""
+    from bempp.core.opencl_kernels import get_kernel_from_name
+
+    kernel1 = get_kernel_from_name(
+        "sum_for_potential_novec", {"COMPLEX_RESULT": None}, "double"
+    )
+    kernel2 = get_kernel_from_name(
+        "sum_for_potential_novec", {"COMPLEX_RESULT": None}, "double"
+    )
+
+    assert len(program_cache) == 1
+    assert kernel1 is not kernel2
+
+
+def test_program_cache_evicts_least_recently_used(program_cache, monkeypatch):
+    """Test that the program cache is bounded by _PROGRAM_CACHE_SIZE."""
+    from bempp.core import opencl_kernels
+    from bempp.core.opencl_kernels import get_kernel_from_name
+
+    monkeypatch.setattr(opencl_kernels, "_PROGRAM_CACHE_SIZE", 2)
+
+    def build(value):
+        get_kernel_from_name("sum_for_potential_novec", {"TEST_OPTION": value})
+
+    build(0)
+    build(1)
+    first_key, second_key = program_cache
+
+    # Using the first program again makes the second one the oldest
+    build(0)
+    build(2)
+
+    assert len(program_cache) == 2
+    assert first_key in program_cache
+    assert second_key not in program_cache
@@ -105,3 +105,42 @@ def test_vectorized_assembly():
     ) / np.abs(grid_fun_non_vec.projections())
 
     assert np.max(rel_diff) < 1e-14
+
+
+def test_vectorized_numba_callable():
+    """Test a vectorized complex callable with a compiled body."""
+    import numba
+
+    grid = bempp.api.shapes.regular_sphere(2)
+    space = bempp.api.function_space(grid, "RWG", 0)
+
+    direction = np.array([1, 2, 3]) / np.sqrt(14)
+    polarization = np.array([0, 0, 1.0])
+    k = 2
+
+    @bempp.api.complex_callable
+    def fun_non_vec(x, n, d, res):
+        value = polarization * np.exp(1j * k * np.dot(x, direction))
+        res[:] = np.cross(value, n)
+
+    @bempp.api.complex_callable(vectorized=True)
+    @numba.njit(parallel=True)
+    def fun_vec(x, n, d, res):
+        for j in numba.prange(x.shape[1]):
+            phase = np.exp(
+                1j
+                * k
+                * (direction[0] * x[0, j] + direction[1] * x[1, j] + direction[2] * x[2, j])
+            )
+            res[0, j] = phase * (polarization[1] * n[2, j] - polarization[2] * n[1, j])
+            res[1, j] = phase * (polarization[2] * n[0, j] - polarization[0] * n[2, j])
+            res[2, j] = phase * (polarization[0] * n[1, j] - polarization[1] * n[0, j])
+
+    grid_fun_non_vec = bempp.api.GridFunction(space, fun=fun_non_vec)
+    grid_fun_vec = bempp.api.GridFunction(space, fun=fun_vec)
+
+    rel_diff = np.linalg.norm(
+        grid_fun_vec.projections() - grid_fun_non_vec.projections()
+    ) / np.linalg.norm(grid_fun_non_vec.projections())
+
+    assert rel_diff < 1e-13
@@ -42,3 +42,63 @@ def test_maxwell_operators(points, operator, wavenumber, space_type):
     )
 
     operator(space, points, wavenumber).evaluate(fun)
+
+
+@pytest.mark.parametrize(
+    "operator, batched_operator",
+    [
+        (maxwell.electric_field, maxwell.electric_field_batched),
+        (maxwell.magnetic_field, maxwell.magnetic_field_batched),
+    ],
+)
+def test_maxwell_batched_operators(points, operator, batched_operator):
+    """Test batched Maxwell far-field operators against separate evaluations."""
+    grid0 = bempp.api.shapes.regular_sphere(1)
+    grid1 = bempp.api.Grid(
+        grid0.vertices + np.array([[3.0], [0], [0]]), grid0.elements
+    )
+    spaces = [function_space(grid, "RWG", 0) for grid in [grid0, grid1]]
+    funs = [
+        bempp.api.GridFunction(
+            space, coefficients=np.random.rand(space.global_dof_count)
+        )
+        for space in spaces
+    ]
+
+    actual = batched_operator(spaces, points, 2.5) * funs
+    expected = sum(
+        operator(space, points, 2.5) * fun for space, fun in zip(spaces, funs)
+    )
+
+    np.testing.assert_allclose(actual, expected, rtol=1e-10)
+
+
+def test_maxwell_batched_operators_share_union_space(points):
+    """Test that batched Maxwell far-field operators can share a union space."""
+    grid0 = bempp.api.shapes.regular_sphere(1)
+    grid1 = bempp.api.Grid(
+        grid0.vertices + np.array([[3.0], [0], [0]]), grid0.elements
+    )
+    spaces = [function_space(grid, "RWG", 0) for grid in [grid0, grid1]]
+    funs = [
+        bempp.api.GridFunction(
+            space, coefficients=np.random.rand(space.global_dof_count)
+        )
+        for space in spaces
+    ]
+
+    electric = maxwell.electric_field_batched(spaces, points, 2.5)
+    magnetic = maxwell.magnetic_field_batched(
+        spaces, points, 2.5, union_space=electric.space
+    )
+
+    assert magnetic.space is electric.space
+    np.testing.assert_allclose(
+        magnetic * funs, maxwell.magnetic_field_batched(spaces, points, 2.5) * funs
+    )
+    np.testing.assert_allclose((2 * electric) * funs, 2 * (electric * funs))
+
+    with pytest.raises(ValueError):
+        electric * funs[0]
+    with pytest.raises(ValueError):
+        electric * funs[::-1]
@@ -55,3 +55,224 @@ def test_maxwell_operators(points, operator, wavenumber, space_type):
     )
 
     operator(space, points, wavenumber).evaluate(fun)
+
+
+@pytest.mark.parametrize("wavenumber", [2.5, 2.5 + 1j])
+def test_maxwell_combined_field(points, wavenumber):
+    """Test that the combined field matches the individual Maxwell potentials."""
+    grid = bempp.api.shapes.regular_sphere(0)
+    space = function_space(grid, "RWG", 0)
+    fun_m = bempp.api.GridFunction(
+        space, coefficients=np.random.rand(space.global_dof_count)
+    )
+    fun_e = bempp.api.GridFunction(
+        space, coefficients=np.random.rand(space.global_dof_count)
+    )
+
+    actual = maxwell.combined_field(space, space, points, wavenumber) * (fun_m, fun_e)
+    expected_e = maxwell.electric_field(space, points, wavenumber) * fun_e
+    expected_m = maxwell.magnetic_field(space, points, wavenumber) * fun_m
+
+    np.testing.assert_allclose(actual[:3], expected_e, rtol=1e-5)
+    np.testing.assert_allclose(actual[3:], expected_m, rtol=1e-5)
+
+
+def test_maxwell_combined_field_scaled_and_invalid(points):
+    """Test scaling of the combined field and rejection of invalid densities."""
+    grid = bempp.api.shapes.regular_sphere(0)
+    space = function_space(grid, "RWG", 0)
+    other_space = function_space(bempp.api.shapes.regular_sphere(1), "RWG", 0)
+    fun = bempp.api.GridFunction(
+        space, coefficients=np.random.rand(space.global_dof_count)
+    )
+    other_fun = bempp.api.GridFunction(
+        other_space, coefficients=np.random.rand(other_space.global_dof_count)
+    )
+
+    combined = maxwell.combined_field(space, space, points, 2.5)
+    expected = combined * (fun, fun)
+
+    np.testing.assert_allclose((2 * combined) * (fun, fun), 2 * expected)
+    np.testing.assert_allclose((-combined) * (fun, fun), -expected)
+
+    with pytest.raises(ValueError):
+        combined * fun
+    with pytest.raises(ValueError):
+        combined * (fun, fun, fun)
+    with pytest.raises(ValueError):
+        combined * (fun, other_fun)
+
+
+def test_maxwell_potentials_far_field_limit():
+    """Test the tiled Numba Maxwell potentials against the far-field limit."""
+    from bempp.api.operators.far_field import maxwell as maxwell_far_field
+
+    # More than one target tile and more than one source tile per thread
+    grid = bempp.api.shapes.regular_sphere(1)
+    space = function_space(grid, "RWG", 0)
+    coefficients = np.random.rand(2, space.global_dof_count)
+    fun_m = bempp.api.GridFunction(space, coefficients=coefficients[0])
+    fun_e = bempp.api.GridFunction(space, coefficients=coefficients[1])
+
+    wavenumber = 2.5
+    radius = 1e4
+    directions = np.random.randn(3, 300)
+    directions /= np.linalg.norm(directions, axis=0)
+    points = radius * directions
+
+    # At large distance the potentials approach exp(ikR) / R times the far-field
+    scale = np.exp(1j * wavenumber * radius) / radius
+    expected_e = scale * maxwell_far_field.electric_field(
+        space, directions, wavenumber, device_interface="numba"
+    ).evaluate(fun_e)
+    expected_m = scale * maxwell_far_field.magnetic_field(
+        space, directions, wavenumber, device_interface="numba"
+    ).evaluate(fun_m)
+
+    actual_e = maxwell.electric_field(
+        space, points, wavenumber, device_interface="numba"
+    ).evaluate(fun_e)
+    actual_m = maxwell.magnetic_field(
+        space, points, wavenumber, device_interface="numba"
+    ).evaluate(fun_m)
+    actual_combined = maxwell.combined_field(
+        space, space, points, wavenumber, device_interface="numba"
+    ) * (fun_m, fun_e)
+
+    for actual, expected in [
+        (actual_e, expected_e),
+        (actual_m, expected_m),
+        (actual_combined[:3], expected_e),
+        (actual_combined[3:], expected_m),
+    ]:
+        np.testing.assert_allclose(
+            actual, expected, rtol=1e-3, atol=1e-3 * np.max(np.abs(expected))
+        )
+
+
+@pytest.mark.parametrize("operator", [maxwell.electric_field, maxwell.magnetic_field])
+def test_maxwell_operators_single_precision(points, operator):
+    """Test that single precision potentials return single precision values."""
+    grid = bempp.api.shapes.regular_sphere(0)
+    space = function_space(grid, "RWG", 0)
+    fun = bempp.api.GridFunction(
+        space, coefficients=np.random.rand(space.global_dof_count)
+    )
+
+    actual = operator(space, points, 2.5, precision="single").evaluate(fun)
+    expected = operator(space, points, 2.5, precision="double").evaluate(fun)
+
+    assert actual.dtype == np.complex64
+    np.testing.assert_allclose(actual, expected, rtol=6e-4)
+
+
+def test_numba_scalar_potentials_stay_in_double_precision(points):
+    """Test that Numba evaluates non-Maxwell potentials in double precision."""
+    grid = bempp.api.shapes.regular_sphere(0)
+    space = function_space(grid, "DP", 0)
+    fun = bempp.api.GridFunction(
+        space, coefficients=np.random.rand(space.global_dof_count)
+    )
+
+    actual = helmholtz.single_layer(
+        space, points, 2.5, precision="single", device_interface="numba"
+    ).evaluate(fun)
+
+    assert actual.dtype == np.complex128
+
+
+@pytest.mark.skipif(
+    not bempp.api.CPU_OPENCL_DRIVER_FOUND, reason="No OpenCL CPU driver found."
+)
+def test_potential_device_type_from_device_interface(points):
+    """Test that the OpenCL device type can be chosen per operator."""
+    grid = bempp.api.shapes.regular_sphere(0)
+    space = function_space(grid, "RWG", 0)
+    fun = bempp.api.GridFunction(
+        space, coefficients=np.random.rand(space.global_dof_count)
+    )
+
+    actual = maxwell.electric_field(
+        space, points, 2.5, device_interface="opencl_cpu"
+    ).evaluate(fun)
+    expected = maxwell.electric_field(
+        space, points, 2.5, device_interface="opencl"
+    ).evaluate(fun)
+
+    np.testing.assert_allclose(actual, expected, rtol=1e-14)
+
+    with pytest.raises(RuntimeError):
+        maxwell.electric_field(
+            space, points, 2.5, device_interface="opencl_tpu"
+        ).evaluate(fun)
+
+
+@pytest.mark.skipif(
+    not bempp.api.CPU_OPENCL_DRIVER_FOUND, reason="No OpenCL CPU driver found."
+)
+@pytest.mark.parametrize("workgroup_size", [16, 64, 256])
+def test_potential_workgroup_size(points, workgroup_size):
+    """Test that the OpenCL potential workgroup size does not change results."""
+    from bempp.api.utils.parameters import DefaultParameters
+
+    grid = bempp.api.shapes.regular_sphere(2)
+    space = function_space(grid, "RWG", 0)
+    fun = bempp.api.GridFunction(
+        space, coefficients=np.random.rand(space.global_dof_count)
+    )
+
+    parameters = DefaultParameters()
+    parameters.assembly.dense.potential_workgroup_size = workgroup_size
+
+    actual = maxwell.electric_field(
+        space, points, 2.5, parameters=parameters, device_interface="opencl"
+    ).evaluate(fun)
+    expected = maxwell.electric_field(
+        space, points, 2.5, device_interface="opencl"
+    ).evaluate(fun)
+
+    np.testing.assert_allclose(actual, expected, rtol=1e-12)
+
+
+@pytest.mark.skipif(
+    not bempp.api.CPU_OPENCL_DRIVER_FOUND, reason="No OpenCL CPU driver found."
+)
+@pytest.mark.parametrize("wavenumber", [2.5, 2.5 + 0.5j])
+def test_potential_specialize_wavenumber(points, wavenumber):
+    """Test that compiling the wavenumber into the kernel does not change results."""
+    from bempp.api.utils.parameters import DefaultParameters
+    from bempp.core.opencl_kernels import _PROGRAM_CACHE
+
+    grid = bempp.api.shapes.regular_sphere(2)
+    space = function_space(grid, "RWG", 0)
+    fun = bempp.api.GridFunction(
+        space, coefficients=np.random.rand(space.global_dof_count)
+    )
+
+    parameters = DefaultParameters()
+    parameters.assembly.dense.specialize_wavenumber = True
+
+    actual = maxwell.combined_field(
+        space,
+        space,
+        points,
+        wavenumber,
+        parameters=parameters,
+        device_interface="opencl",
+    ).evaluate(fun, fun)
+    expected = maxwell.combined_field(
+        space, space, points, wavenumber, device_interface="opencl"
+    ).evaluate(fun, fun)
+
+    np.testing.assert_allclose(actual, expected, rtol=1e-10)
+
+    # The sum kernel does not depend on the wavenumber and must not be
+    # compiled once per wavenumber.
+    sum_options = [
+        option
+        for file_name, kernel_options, _ in _PROGRAM_CACHE
+        if file_name == "sum_for_potential_novec.cl"
+        for option in kernel_options
+    ]
+    assert sum_options
+    assert not any(option.startswith("WAVENUMBER_") for option in sum_options)